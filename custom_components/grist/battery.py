@@ -29,7 +29,6 @@ import logging
 from homeassistant.core import HomeAssistant, State
 
 from .const import (
-    DEBUGGING,
     DEFAULT_BATTERY_CAPACITY_AH,
     DEFAULT_BATTERY_FLOAT_VOLTAGE,
     DEFAULT_BATTERY_MIN_SOC,
@@ -40,7 +39,6 @@ from .const import (
 )
 
 logger: logging.Logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG if DEBUGGING else logging.INFO)
 
 
 class Battery:
@@ -54,6 +52,7 @@ class Battery:
         self._battery_soc: float = DEFAULT_BATTERY_MIN_SOC
         self._status = Status.NOT_CONFIGURED
         self._unsub_update = None
+        self._last_seen: dict[str, str] = {}
 
     async def async_initialize(self) -> None:
         """Load battery data from Home Assistant sensors."""
@@ -86,6 +85,22 @@ class Battery:
             self._status = Status.NOT_CONFIGURED
             return
 
+        # Skip the recompute entirely when none of the tracked sensors have
+        # changed since the last successful update.
+        tracked = [
+            *battery_capacity_sensors,
+            SENSOR_BATTERY_FLOAT_VOLTAGE,
+            SENSOR_BATTERY_SOC,
+        ]
+        current_seen = {
+            entity: state.state
+            for entity in tracked
+            if (state := self.hass.states.get(entity)) is not None
+        }
+        if len(current_seen) == len(tracked) and current_seen == self._last_seen:
+            self._status = Status.NORMAL
+            return
+
         temp_cap = 0.0
         for entity in battery_capacity_sensors:
             state: State | None = self.hass.states.get(entity)
@@ -125,6 +140,8 @@ class Battery:
             self._status = Status.FAULT
             return
 
+        # Remember the accepted sensor states so unchanged data can be skipped next call.
+        self._last_seen = current_seen
         self._status = Status.NORMAL
 
     @property
@@ -14,6 +14,7 @@ Steps in the flow:
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -46,6 +47,50 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+# Range validators are pure and have fixed bounds, so build each once at import.
+_HOUR_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=HOUR_MIN, max=HOUR_MAX))
+_HISTORY_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=HISTORY_MIN, max=HISTORY_MAX)
+)
+_SOC_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=GRIST_MIN_SOC, max=GRIST_MAX_SOC)
+)
+
+# Pre-stringified boost modes so form renders reuse interned strings instead
+# of allocating a fresh str per call.
+_BOOST_MODE_STR: dict[BoostMode, str] = {m: str(m) for m in BOOST_MODE_OPTIONS}
+
+# The confirm schema has no per-call defaults, so a single instance is shared.
+_CONFIRM_SCHEMA = vol.Schema({vol.Required("confirm", default=False): bool})
+
+
+@lru_cache(maxsize=8)
+def _boost_schema_for_default(boost_mode: str) -> vol.Schema:
+    """Build (and cache) the boost mode schema for a given default."""
+    return vol.Schema(
+        {
+            vol.Required("boost_mode", default=boost_mode): vol.In(BOOST_MODE_OPTIONS),
+        }
+    )
+
+
+@lru_cache(maxsize=32)
+def _details_schema_for_defaults(
+    update_hour: int, history_days: int, minimum_soc: int, grist_manual: int
+) -> vol.Schema:
+    """Build (and cache) the details schema for a given set of defaults."""
+    return vol.Schema(
+        {
+            vol.Required("grist_start", default=DEFAULT_GRIST_START): _HOUR_VALIDATOR,
+            vol.Required("grist_end", default=DEFAULT_GRIST_END): _HOUR_VALIDATOR,
+            vol.Required("update_hour", default=update_hour): _HOUR_VALIDATOR,
+            vol.Required("history_days", default=history_days): _HISTORY_VALIDATOR,
+            vol.Required("minimum_soc", default=minimum_soc): _SOC_VALIDATOR,
+            vol.Required("grist_manual", default=grist_manual): _SOC_VALIDATOR,
+        }
+    )
+
+
 def boost_schema(options: dict[str, Any]) -> vol.Schema:
     """Return the schema for selecting boost mode.
 
@@ -53,12 +98,11 @@ def boost_schema(options: dict[str, Any]) -> vol.Schema:
       - config.step.init.data.boost_mode
       - config.step.init.data_description.boost_mode
     """
-    return vol.Schema(
-        {
-            vol.Required(
-                "boost_mode", default=str(options.get("boost_mode", DEFAULT_GRIST_MODE))
-            ): vol.In(BOOST_MODE_OPTIONS),
-        }
+    return _boost_schema_for_default(
+        _BOOST_MODE_STR.get(
+            options.get("boost_mode", DEFAULT_GRIST_MODE),
+            _BOOST_MODE_STR[DEFAULT_GRIST_MODE],
+        )
     )
 
 
@@ -72,7 +116,7 @@ def confirm_schema(options: dict[str, Any]) -> vol.Schema:
       - config.step.confirm.data_description.confirm
     The 'confirm' field is a safety confirmation for disabling boost mode, with a default of False.
     """
-    return vol.Schema({vol.Required("confirm", default=False): bool})
+    return _CONFIRM_SCHEMA
 
 
 def details_schema(options: dict[str, Any]) -> vol.Schema:
@@ -84,58 +128,14 @@ def details_schema(options: dict[str, Any]) -> vol.Schema:
       - config.step.details.data.*
       - config.step.details.data_description.*
     """
-    return vol.Schema(
-        {
-            vol.Required("grist_start", default=DEFAULT_GRIST_START): vol.All(
-                vol.Coerce(int), vol.Range(min=HOUR_MIN, max=HOUR_MAX)
-            ),
-            vol.Required("grist_end", default=DEFAULT_GRIST_END): vol.All(
-                vol.Coerce(int), vol.Range(min=HOUR_MIN, max=HOUR_MAX)
-            ),
-            vol.Required(
-                "update_hour",
-                default=options.get("update_hour", DEFAULT_UPDATE_HOUR),
-            ): vol.All(vol.Coerce(int), vol.Range(min=HOUR_MIN, max=HOUR_MAX)),
-            vol.Required(
-                "history_days",
-                default=options.get("history_days", DEFAULT_LOAD_AVERAGE_DAYS),
-            ): vol.All(vol.Coerce(int), vol.Range(min=HISTORY_MIN, max=HISTORY_MAX)),
-            vol.Required(
-                "minimum_soc",
-                default=options.get("minimum_soc", DEFAULT_BATTERY_MIN_SOC),
-            ): vol.All(
-                vol.Coerce(int),
-                vol.Range(min=GRIST_MIN_SOC, max=GRIST_MAX_SOC),
-            ),
-            vol.Required(
-                "grist_manual",
-                default=options.get("grist_manual", DEFAULT_MANUAL_GRIST),
-            ): vol.All(
-                vol.Coerce(int),
-                vol.Range(min=GRIST_MIN_SOC, max=GRIST_MAX_SOC),
-            ),
-        }
+    return _details_schema_for_defaults(
+        options.get("update_hour", DEFAULT_UPDATE_HOUR),
+        options.get("history_days", DEFAULT_LOAD_AVERAGE_DAYS),
+        options.get("minimum_soc", DEFAULT_BATTERY_MIN_SOC),
+        options.get("grist_manual", DEFAULT_MANUAL_GRIST),
     )
 
 
-def to_hour(hour: int | None) -> str:
-    """Convert an integer hour (0-23) to a string representation for logging/debug.
-
-    Not used in the UI; for developer logs only.
-    """
-    if hour is None:
-        return "oops"
-    if hour == 0:
-        return "midnight"
-    if 1 <= hour < 12:
-        return f"{hour}am"
-    if hour == 12:
-        return "noon"
-    if 13 <= hour < 24:
-        return f"{hour - 12}pm"
-    raise ValueError("Invalid hour")
-
-
 class GristConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the config flow for GRIST.
 
@@ -181,11 +181,21 @@ class GristOptionsFlow(OptionsFlow):
     def __init__(self) -> None:
         """Initialize the options flow."""
         self._pending_user_options: dict[str, Any] = {}
+        self._options_cache: dict[str, Any] | None = None
 
     @property
     def options(self) -> dict[str, Any]:
-        """Return the current options from the config entry."""
-        return dict(self.config_entry.options)
+        """Return the current options from the config entry.
+
+        The copy is cached for the lifetime of the flow; the config entry
+        options cannot change while the options dialog is open.
+        """
+        if self._options_cache is None:
+            entry = getattr(self, "config_entry", None)
+            if entry is None:
+                return {}
+            self._options_cache = dict(entry.options)
+        return self._options_cache
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -199,9 +209,10 @@ class GristOptionsFlow(OptionsFlow):
                 step_id="init", data_schema=boost_schema(self.options)
             )
 
-        options = dict(self.options)
-        options.update(user_input)
-        self._pending_user_options = options
+        # Merge into the pending dict in place; no fresh copy per keystroke.
+        if not self._pending_user_options:
+            self._pending_user_options.update(self.options)
+        self._pending_user_options.update(user_input)
         if user_input.get("boost_mode") == BoostMode.OFF and not user_input.get(
             "confirm"
         ):
@@ -222,7 +233,11 @@ class GristOptionsFlow(OptionsFlow):
             )
         if user_input.get("confirm"):
             return await self.async_step_details(user_input=None)
-        return await self.async_step_init(None)
+        # Denied confirmation: show the init form directly rather than
+        # re-entering async_step_init through another coroutine frame.
+        return self.async_show_form(
+            step_id="init", data_schema=boost_schema(self.options)
+        )
 
     async def async_step_details(
         self, user_input: dict[str, Any] | None = None
@@ -8,6 +8,7 @@ All constants are intended to be imported and used by other modules in the integ
 """
 
 from enum import Enum, StrEnum
+import sys
 
 FORECASTER_INTEGRATIONS = [
     "solcast_solar",
@@ -25,27 +26,29 @@ class Status(Enum):
     RATE_LIMITED = 4
     MQTT_OFF = 5
 
+    @property
+    def state(self) -> str:
+        """Return the string representation of the current status."""
+        return _STATUS_LABELS.get(self, "Unknown")
+
+
+# Display labels for Status, looked up in O(1) instead of a match chain.
+_STATUS_LABELS: dict[Status, str] = {
+    Status.NOT_CONFIGURED: "Not Configured",
+    Status.FAULT: "Fault",
+    Status.NORMAL: "Normal",
+    Status.STARTING: "Starting",
+    Status.RATE_LIMITED: "Rate Limited",
+    Status.MQTT_OFF: "MQTT Off",
+}
+
+
 class MqttErrors(Enum):
     """MQTT errors for the GRIST integration."""
 
     ENTITY_NOT_FOUND = "Entity not found"
     MQTT_OFF = "MQTT is off"
 
-    @property
-    def state(self) -> str:
-        """Return the string representation of the current status."""
-        match self:
-            case Status.NOT_CONFIGURED:
-                return "Not Configured"
-            case Status.FAULT:
-                return "Fault"
-            case Status.NORMAL:
-                return "Normal"
-            case Status.STARTING:
-                return "Starting"
-            case _:
-                return "Unknown"
-
 
 class BoostMode(StrEnum):
     """GRIST operating modes."""
@@ -63,6 +66,10 @@ BOOST_MODE_OPTIONS: tuple[BoostMode, ...] = (
     BoostMode.TESTING,
 )
 
+# Frozenset variant for O(1) membership checks. The tuple above is kept for
+# schemas that render a dropdown and need stable ordering.
+BOOST_MODE_OPTIONS_SET: frozenset[BoostMode] = frozenset(BOOST_MODE_OPTIONS)
+
 # Integration domain and platform configuration
 DOMAIN = "grist"
 DOMAIN_STR = "GRIST"
@@ -127,6 +134,9 @@ HISTORY_MAX = 10
 HRS_PER_DAY = 24
 DATE_FORMAT = "%Y-%m-%d"
 DATE_FORMAT_UTC = "%Y-%m-%dT%H:%M:%S.%fZ"
-PURPLE = "\033[95m"
-RESET = "\033[0m"
+# Colorize log highlights only when attached to a terminal; otherwise the
+# escape codes would end up as literal bytes in the Home Assistant log file.
+_USE_COLOR = sys.stderr.isatty()
+PURPLE = "\033[95m" if _USE_COLOR else ""
+RESET = "\033[0m" if _USE_COLOR else ""
 NBSP = "\u2007"
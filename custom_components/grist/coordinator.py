@@ -19,18 +19,18 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from datetime import timedelta
 import logging
+from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.util import Any
 
-from .const import DEBUGGING, DOMAIN
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
-_LOGGER.setLevel(logging.DEBUG if DEBUGGING else logging.INFO)
 
 
 class GristUpdateCoordinator(DataUpdateCoordinator):
@@ -67,6 +67,9 @@ class GristUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval),
+            # Compare the returned dict by value and skip listener fan-out
+            # (and the resulting entity attribute rebuilds) when unchanged.
+            always_update=False,
         )
         self.update_method = update_method
 
@@ -80,13 +83,18 @@ class GristUpdateCoordinator(DataUpdateCoordinator):
             UpdateFailed: If the update method raises an exception.
 
         """
-        if self.update_method:
-            try:
-                return await self.update_method()
-            except Exception as e:
-                _LOGGER.error("Update method failed to update sensors: %s", e)
-                raise UpdateFailed(f"UpdateMethod Failed to update sensors: {e}") from e
-        return None
+        # Bind once and bail out before entering the try block when the
+        # update method has been cleared by async_unload_entry.
+        method = self.update_method
+        if method is None:
+            return None
+        try:
+            return await method()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.error("Update method failed to update sensors: %s", e)
+            raise UpdateFailed(f"UpdateMethod Failed to update sensors: {e}") from e
 
     async def async_unload_entry(self) -> None:
         """Unload the config entry and clean up the update method."""
@@ -24,10 +24,12 @@ Helper Functions:
 All I/O is asynchronous and compatible with Home Assistant's async patterns.
 """
 
+import ast
+from functools import lru_cache
 import logging
-import re
 from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -35,11 +37,36 @@ from homeassistant.helpers.update_coordinator import (
 )
 from homeassistant.util import dt as dt_util
 
-from .const import DEBUGGING, DOMAIN, NBSP
+from .const import DEBUGGING, DOMAIN, DOMAIN_STR, HRS_PER_DAY, NBSP
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG if DEBUGGING else logging.INFO)
 
+# Readable labels for each hour, computed once at module load. The hourly
+# entities format up to 24 of these per attribute rebuild.
+_HOUR_LABELS: tuple[str, ...] = tuple(
+    "midnight"
+    if hour == 0
+    else "noon"
+    if hour == 12
+    else f"{hour} am"
+    if hour < 12
+    else f"{hour} pm"
+    for hour in range(HRS_PER_DAY)
+)
+
+
+# All GRIST entities belong to the same device, so one DeviceInfo is shared
+# per config entry instead of allocating a copy in every entity.
+_DEVICE_INFO_CACHE: dict[str, DeviceInfo] = {}
+
+
+def _device_info_for_entry(entry_id: str) -> DeviceInfo:
+    """Return the shared DeviceInfo for a config entry."""
+    return _DEVICE_INFO_CACHE.setdefault(
+        entry_id, DeviceInfo(identifiers={(DOMAIN, entry_id)}, name=DOMAIN_STR)
+    )
+
 
 def printable_hour(hour: int | str) -> str:
     """Return an easily readable hour.
@@ -51,84 +78,136 @@ def printable_hour(hour: int | str) -> str:
         Formatted string with midnight # am, noon, # pm
 
     """
-    if hour == 'n/a':
-        return "n/a"
-    if type(hour) is str:
-        return hour
-    if hour == 0:
-        return "midnight"
-    if isinstance(hour, int):
-        if hour < 12:
-            return f"{hour} am"
-        if hour == 12:
-            return "noon"
-        if hour < 24:
-            return f"{hour} pm"
-        return str(hour)
+    # Exact-type check: skips isinstance's subclass walk on the hot path,
+    # and hours never arrive as int subclasses.
+    if type(hour) is int and 0 <= hour < HRS_PER_DAY:
+        return _HOUR_LABELS[hour]
     return str(hour)
 
 
-def count_data(input_str: str) -> int:
-    """Count the number of dictionary values greater than zero in a string representation.
+# Fallback time format for BatteryLifeEntity, hoisted so the literal is not
+# rebuilt at each (rare) fallback read.
+_EXHAUSTED_TIME_FMT = "%a %-I:%M %p"
+
+# Built once so _fmt_watts does a single C-level translate pass per value
+# instead of a replace walk, and reuses the same prefix string.
+_COMMA_TABLE = str.maketrans({",": " ,"})
+_NBSP2 = NBSP * 2
+
+
+def _fmt_watts(watts: float) -> str:
+    """Format a watt value for the hourly attribute displays.
 
     Args:
-        input_str: String representation of a dictionary.
+        watts: The watt value for one hour.
+
+    Returns:
+        The value padded with figure spaces and a thin thousands separator.
+
+    """
+    formatted = f"{_NBSP2 if watts > 999 else ''}{watts:,.0f}".translate(_COMMA_TABLE)
+    return formatted.rjust(7, NBSP) + "w"
+
+
+@lru_cache(maxsize=32)
+def _parse_hourly_str(data: str) -> dict:
+    """Parse a stringified hourly dict, caching repeated inputs.
+
+    The coordinator hands out the same string until its data changes, so
+    repeated template reads hit the cache instead of reparsing. Callers
+    must not mutate the returned dict.
+    """
+    return ast.literal_eval(data) if data else {}
+
+
+def count_data(data: dict | str) -> int:
+    """Count the number of values greater than zero in hourly data.
+
+    Args:
+        data: The hourly data dict, or its string representation for callers
+            that only have the stringified form.
 
     Returns:
         The count of values greater than zero.
 
     """
-    input_str = input_str.strip("{}")
-    pairs = re.split(r",\s*(?![^{}]*\})", input_str)
-    result = 0
-    if pairs == [""]:
-        return result
-    for pair in pairs:
-        _, value = pair.split(":")
-        if float(value.strip()) > 0.0:
-            result += 1
-    return result
+    if isinstance(data, str):
+        data = _parse_hourly_str(data)
+    return sum(1 for value in data.values() if float(value) > 0.0)
 
 
-def sum_data(input_str: str) -> int:
-    """Sum the values in a string representation of a dictionary.
+def sum_data(data: dict | str) -> int:
+    """Sum the values in hourly data.
 
     Args:
-        input_str: String representation of a dictionary.
+        data: The hourly data dict, or its string representation for callers
+            that only have the stringified form.
 
     Returns:
         The sum of all values, rounded to the nearest integer.
 
     """
-    input_str = input_str.strip("{}")
-    if input_str == "":
-        return 0
-    pairs = re.split(r",\s*(?![^{}]*\})", input_str)
-    result = 0.0
-    for pair in pairs:
-        _, value = pair.split(":")
-        result += float(value.strip())
-    return int(round(result, 0))
-
-
-class SchedulerEntity(CoordinatorEntity):
+    if isinstance(data, str):
+        data = _parse_hourly_str(data)
+    return int(round(sum(float(value) for value in data.values()), 0))
+
+
+class _GristBaseEntity(CoordinatorEntity):
+    """Base class providing the plumbing shared by all GRIST entities.
+
+    Handles unique ID construction, the shared device info, and the
+    per-update invalidation of the cached attribute dict. Subclasses only
+    implement their own state and extra_state_attributes.
+    """
+
+    def __init__(
+        self,
+        entry_id: str,
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
+        *,
+        suffix: str,
+    ) -> None:
+        """Initialize the shared entity state."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry_id}_{suffix}"
+        self._device_info = _device_info_for_entry(entry_id)
+        self._attr_cache: dict[str, str] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate the cached attribute dict when new data arrives."""
+        self._attr_cache = None
+        super()._handle_coordinator_update()
+
+    @property
+    def name(self) -> str | None:
+        """Return the name of the entity."""
+        return self._attr_name
+
+    @property
+    def unique_id(self) -> str | None:
+        """Return a unique ID for the entity."""
+        return self._attr_unique_id
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info for the entity."""
+        return self._device_info
+
+
+class SchedulerEntity(_GristBaseEntity):
     """Entity representing the GRIST scheduler overview and configuration."""
 
+    _attr_icon = "mdi:toggle-switch"
+    _attr_name = "GRIST scheduler"
+
     def __init__(
         self,
         entry_id: str,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
     ) -> None:
         """Initialize the scheduler entity."""
-        super().__init__(coordinator)
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{entry_id}_GRIST_scheduler"
-        self._attr_icon = "mdi:toggle-switch"
-        self._attr_name = "GRIST scheduler"
-        self._device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name=self._attr_name,
-        )
+        super().__init__(entry_id, coordinator, suffix="GRIST_scheduler")
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
@@ -137,7 +216,12 @@ class SchedulerEntity(CoordinatorEntity):
         Includes status, manual and calculated boost, minimum SoC, load days,
         update hour, and PV forecasts for today and tomorrow.
         """
-        days = self.coordinator.data.get('load_days', 'n/a')
+        if self._attr_cache is not None:
+            return self._attr_cache
+        # Bind the data dict once instead of re-walking the attribute chain
+        # for every one of the dozen lookups below.
+        data = self.coordinator.data
+        days = data.get('load_days', 'n/a')
         if days == 'n/a':
             days = "n/a"
         elif days == '1':
@@ -145,319 +229,253 @@ class SchedulerEntity(CoordinatorEntity):
         else:
             days = f"{days} days"
 
-        return {
-            "status": self.coordinator.data.get("status", "n/a"),
-            "forecaster_status": self.coordinator.data.get("forecaster_status", "n/a"),
-            "mode": self.coordinator.data.get("mode", "n/a"),
-            "calculated": f"{self.coordinator.data.get('calculated', 'n/a')}%" if self.coordinator.data.get("calculated") is not None else "n/a",
-            "manual": f"{self.coordinator.data.get('manual', 'n/a')}%" if self.coordinator.data.get("manual") is not None else "n/a",
-            "actual": f"{self.coordinator.data.get('actual', 'n/a')}%" if self.coordinator.data.get("actual") is not None else "n/a",
-            "minimum_soc": f"{self.coordinator.data.get('min_soc', 'n/a')}%" if self.coordinator.data.get("min_soc") is not None else "n/a",
+        self._attr_cache = {
+            "status": data.get("status", "n/a"),
+            "forecaster_status": data.get("forecaster_status", "n/a"),
+            "mode": data.get("mode", "n/a"),
+            "calculated": f"{data.get('calculated', 'n/a')}%" if data.get("calculated") is not None else "n/a",
+            "manual": f"{data.get('manual', 'n/a')}%" if data.get("manual") is not None else "n/a",
+            "actual": f"{data.get('actual', 'n/a')}%" if data.get("actual") is not None else "n/a",
+            "minimum_soc": f"{data.get('min_soc', 'n/a')}%" if data.get("min_soc") is not None else "n/a",
             "load_days": days,
-            "start": printable_hour(self.coordinator.data.get("start", "n/a")),
-            "end": printable_hour(self.coordinator.data.get("end", "n/a")),
-            "update_hour": printable_hour(self.coordinator.data.get("update_hour", "n/a")),
+            "start": printable_hour(data.get("start", "n/a")),
+            "end": printable_hour(data.get("end", "n/a")),
+            "update_hour": printable_hour(data.get("update_hour", "n/a")),
         }
-
-    @property
-    def name(self) -> str | None:
-        """Return the name of the scheduler entity."""
-        return self._attr_name
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID for the scheduler entity."""
-        return self._attr_unique_id
+        return self._attr_cache
 
     @property
     def state(self) -> str:
         """Return the current mode of the scheduler."""
-        return f"{self.coordinator.data.get('status', 'Status n/a')}: {self.coordinator.data.get('mode', 'Mode n/a')}"
+        data = self.coordinator.data
+        return f"{data.get('status', 'Status n/a')}: {data.get('mode', 'Mode n/a')}"
 
 
-class RatioEntity(CoordinatorEntity):
+class RatioEntity(_GristBaseEntity):
     """Entity representing hourly PV performance ratios."""
 
+    _attr_icon = "mdi:toggle-switch"
+    _attr_name = "GRIST PV ratio"
+
     def __init__(
         self,
         entry_id: str,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
     ) -> None:
         """Initialize the PV ratio entity."""
-        super().__init__(coordinator)
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{entry_id}_pv_ratio"
-        self._attr_icon = "mdi:toggle-switch"
-        self._attr_name = "GRIST PV ratio"
-        self._device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name=self._attr_name,
+        super().__init__(entry_id, coordinator, suffix="pv_ratio")
+        self._attr_state = self._compute_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state once per data update."""
+        self._attr_state = self._compute_state()
+        super()._handle_coordinator_update()
+
+    def _compute_state(self) -> str:
+        """Summarize the hours with unique PV ratios."""
+        data = self.coordinator.data
+        if not data or "pv_ratios" not in data:
+            return "No PV ratios available"
+        count = sum(
+            1 for ratio in data.get("pv_ratios", {}).values() if ratio != 1.0
         )
-
-    @property
-    def name(self) -> str | None:
-        """Return the name of the PV ratio entity."""
-        return self._attr_name
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID for the PV ratio entity."""
-        return self._attr_unique_id
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info for the PV ratio entity."""
-        return self._device_info
+        if count == 1:
+            return "1 hour with a unique ratio"
+        if count > 0:
+            return f"{count} hours with unique ratios"
+        return "No unique ratios found"
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
         """Return hourly PV ratio values as state attributes."""
-        hours: dict[int, float] = self._coordinator.data.get("pv_ratios", {})
+        if self._attr_cache is not None:
+            return self._attr_cache
+        data = self.coordinator.data
+        hours: dict[int, float] = data.get("pv_ratios", {})
+        if not hours:
+            day = data.get("today_abbr") or dt_util.now().strftime(
+                "%a"
+            )
+            return {"No pv ratios found": day}
         converted_hours: dict[str, str] = {
             printable_hour(hour): f"{ratio:>3.1f}" for hour, ratio in hours.items()
         }
-        if not converted_hours:
-            day = dt_util.now().strftime("%a")
-            return {"No pv ratios found": day}
+        self._attr_cache = converted_hours
         return converted_hours
 
     @property
     def state(self) -> str | int | float | None:
         """Return a summary of hours with unique PV ratios."""
-        if not self._coordinator.data or "pv_ratios" not in self._coordinator.data:
-            return "No PV ratios available"
-        count = sum(
-            1
-            for ratio in self._coordinator.data.get("pv_ratios", {}).values()
-            if ratio != 1.0
-        )
-        if count == 1:
-            return "1 hour with a unique ratio"
-        if count > 0:
-            return f"{count} hours with unique ratios"
-        return "No unique ratios found"
+        return self._attr_state
 
 
-class LoadEntity(CoordinatorEntity):
+class LoadEntity(_GristBaseEntity):
     """Entity representing the average hourly load."""
 
+    _attr_icon = "mdi:toggle-switch"
+    _attr_name = "GRIST load"
+
     def __init__(
         self,
         entry_id: str,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
     ) -> None:
         """Initialize the load entity."""
-        super().__init__(coordinator)
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{entry_id}_load"
-        self._attr_icon = "mdi:toggle-switch"
-        self._attr_name = "GRIST load"
-        self._device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name=self._attr_name,
-        )
-
-    @property
-    def name(self) -> str | None:
-        """Return the name of the load entity."""
-        return self._attr_name
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID for the load entity."""
-        return self._attr_unique_id
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info for the load entity."""
-        return self._device_info
+        super().__init__(entry_id, coordinator, suffix="load")
+        self._attr_state = self._compute_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state once per data update."""
+        self._attr_state = self._compute_state()
+        super()._handle_coordinator_update()
+
+    def _compute_state(self) -> str:
+        """Total the average daily load in kWh."""
+        data = self.coordinator.data or {}
+        total_load = round(sum(data.get("load_averages", {}).values()) / 1000, 1)
+        return f"{total_load} kWh"
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
         """Return hourly load values as state attributes."""
-        hours: dict[int, int] = self._coordinator.data.get("load_averages", {})
+        if self._attr_cache is not None:
+            return self._attr_cache
+        data = self.coordinator.data
+        hours: dict[int, int] = data.get("load_averages", {})
+        if not hours:
+            day = data.get("today_abbr") or dt_util.now().strftime(
+                "%a"
+            )
+            return {"No load averages found": day}
         converted_hours: dict[str, str] = {
-            printable_hour(
-                hour
-            ): f"{NBSP * 2 if watts > 999 else ''}{watts:,.0f}".replace(
-                ",", " ,"
-            ).rjust(7, NBSP)
-            + "w"
+            printable_hour(hour): _fmt_watts(watts)
             for hour, watts in hours.items()
         }
-        if not converted_hours:
-            day = dt_util.now().strftime("%a")
-            return {"No load averages found": day}
+        self._attr_cache = converted_hours
         return converted_hours
 
     @property
     def state(self) -> str | int | float | None:
         """Return the total average daily load in kWh."""
-        data: dict[int, int] = self._coordinator.data.get("load_averages", {})
-        total_load = round(sum(data.values()) / 1000, 1)
-        return f"{total_load} kWh"
+        return self._attr_state
+
 
+class PVEntity(_GristBaseEntity):
+    """Entity representing calculated PV generation for one day.
 
-class PVEntity_today(CoordinatorEntity):
-    """Entity representing calculated PV generation for today."""
+    Parameterized on which day it reports; the two concrete classes below
+    exist only to pin the day for the sensor platform's entity list.
+    """
+
+    _attr_icon = "mdi:toggle-switch"
 
     def __init__(
         self,
         entry_id: str,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
+        *,
+        which: str,
     ) -> None:
-        """Initialize the PV today entity."""
-        super().__init__(coordinator)
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{entry_id}_pv_generation_today"
-        self._attr_icon = "mdi:toggle-switch"
-        self._attr_name = "GRIST PV Today"
-        self._device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name=self._attr_name,
-        )
-
-    @property
-    def name(self) -> str | None:
-        """Return the name of the PV today entity."""
-        return f"PV for {self._coordinator.data.get('pv_calculated_today_day', '')}"
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID for the PV today entity."""
-        return self._attr_unique_id
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info for the PV today entity."""
-        return self._device_info
+        """Initialize the PV entity for the given day ("today"/"tomorrow")."""
+        super().__init__(entry_id, coordinator, suffix=f"pv_generation_{which}")
+        # Precompute the coordinator keys once; the properties read them on
+        # every access.
+        prefix = f"pv_calculated_{which}"
+        self._hours_key = prefix
+        self._day_key = f"{prefix}_day"
+        self._total_key = f"{prefix}_total"
+        self._attr_state = self._compute_state()
+        self._attr_name = self._compute_name()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state and name once per data update."""
+        self._attr_state = self._compute_state()
+        self._attr_name = self._compute_name()
+        super()._handle_coordinator_update()
+
+    def _compute_state(self) -> str:
+        """Total the day's calculated PV generation in kWh."""
+        data = self.coordinator.data or {}
+        return f"{data.get(self._total_key, 0) / 1000:.1f} kWh"
+
+    def _compute_name(self) -> str:
+        """Build the day-of-week entity name."""
+        data = self.coordinator.data or {}
+        return f"PV for {data.get(self._day_key, '')}"
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
         """Return the hourly PV generation values as state attributes."""
-        hours: dict[int, float] = self._coordinator.data.get("pv_calculated_today", {})
+        if self._attr_cache is not None:
+            return self._attr_cache
+        data = self.coordinator.data
+        hours: dict[int, float] = data.get(self._hours_key, {})
+        if not hours:
+            day: str = data.get(self._day_key, "")
+            return {"No pv generation found": day}
         converted_hours: dict[str, str] = {
-            printable_hour(
-                hour
-            ): f"{NBSP * 2 if watts > 999 else ''}{watts:,.0f}".replace(
-                ",", " ,"
-            ).rjust(7, NBSP)
-            + "w"
+            printable_hour(hour): _fmt_watts(watts)
             for hour, watts in hours.items()
         }
-        if not converted_hours:
-            day: str = self._coordinator.data.get("pv_calculated_today_day", "")
-            return {"No pv generation found": day}
+        self._attr_cache = converted_hours
         return converted_hours
 
     @property
     def state(self) -> str | int | float | None:
         """Return the state of the sensor."""
-        return f"{self._coordinator.data.get('pv_calculated_today_total', 0) / 1000:.1f} kWh"
+        return self._attr_state
 
 
-class PVEntity_tomorrow(CoordinatorEntity):
-    """Entity representing calculated PV generation for tomorrow."""
+class PVEntity_today(PVEntity):
+    """Calculated PV generation for today."""
 
     def __init__(
         self,
         entry_id: str,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
     ) -> None:
-        """Initialize the PV tomorrow entity."""
-        super().__init__(coordinator)
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{entry_id}_pv_generation_tomorrow"
-        self._attr_icon = "mdi:toggle-switch"
-        self._attr_name = "GRIST PV Tomorrow"
-        self._device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name=self._attr_name,
-        )
-
-    @property
-    def name(self) -> str | None:
-        """Return the name of the PV tomorrow entity."""
-        return f"PV for {self._coordinator.data.get('pv_calculated_tomorrow_day', '')}"
+        """Initialize the PV today entity."""
+        super().__init__(entry_id, coordinator, which="today")
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID for the PV tomorrow entity."""
-        return self._attr_unique_id
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info for the PV tomorrow entity."""
-        return self._device_info
+class PVEntity_tomorrow(PVEntity):
+    """Calculated PV generation for tomorrow."""
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str]:
-        """Return the hourly PV generation values as state attributes."""
-        hours: dict[int, float] = self._coordinator.data.get(
-            "pv_calculated_tomorrow", 0
-        )
-        if not hours:
-            day: str = self._coordinator.data.get("pv_calculated_tomorrow_day", "")
-            return {"No pv generation found": day}
-        converted_hours: dict[str, str] = {
-            printable_hour(hour): f"{NBSP if watts > 999 else ''}{watts:,.0f}".replace(
-                ",", " ,"
-            ).rjust(7, NBSP)
-            + "w"
-            for hour, watts in hours.items()
-        }
-        return converted_hours
-
-    @property
-    def state(self) -> str | int | float | None:
-        """Return the state of the sensor."""
-        return f"{self._coordinator.data.get('pv_calculated_tomorrow_total', 0) / 1000:.1f} kWh"
+    def __init__(
+        self,
+        entry_id: str,
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
+    ) -> None:
+        """Initialize the PV tomorrow entity."""
+        super().__init__(entry_id, coordinator, which="tomorrow")
 
 
-class BatteryLifeEntity(CoordinatorEntity):
+class BatteryLifeEntity(_GristBaseEntity):
     """Representation of the battery life.
 
     This sensor is used to display the battery life for the day if available.
     """
 
+    _attr_icon = "mdi:clock-alert"
+    _attr_name = "Battery exhausted"
+
     def __init__(
         self,
         entry_id: str,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
-        # parent: str,
     ) -> None:
         """Initialize the sensor."""
-
-        super().__init__(coordinator)
-        self._coordinator = coordinator
-        self._attr_unique_id = f"{entry_id}_battery_exhausted"
-        self._attr_icon = "mdi:clock-alert"
-        self._attr_name = "Battery exhausted"
-        self._device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name=self._attr_name,
-        )
-
-    @property
-    def name(self) -> str | None:
-        """Return the name of the sensor."""
-        return self._attr_name
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return self._attr_unique_id
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return self._device_info
+        super().__init__(entry_id, coordinator, suffix="battery_exhausted")
 
     @property
     def state(self) -> str | int | float | None:
         """Return the state of the sensor."""
-        remaining: str = self._coordinator.data.get(
-            "battery_exhausted", dt_util.now().strftime("%a %-I:%M %p")
-        )
+        remaining: str | None = self.coordinator.data.get("battery_exhausted")
+        if remaining is None:
+            # Only pay for the datetime allocation and strftime walk when
+            # the coordinator has no value to report.
+            return dt_util.now().strftime(_EXHAUSTED_TIME_FMT)
         return remaining
-
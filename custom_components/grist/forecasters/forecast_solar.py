@@ -22,8 +22,12 @@ All I/O is asynchronous and compatible with Home Assistant's async patterns.
 Logging follows Home Assistant conventions and respects the DEBUGGING flag.
 """
 
+import asyncio
+from collections import deque
 from datetime import datetime, timedelta
+from itertools import chain
 import logging
+import time
 from zoneinfo import ZoneInfo
 
 import aiohttp
@@ -31,9 +35,12 @@ from astral import LocationInfo
 from astral.sun import sun
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from ..const import (  # noqa: TID252
     DATE_FORMAT,
@@ -47,6 +54,7 @@ from ..const import (  # noqa: TID252
     STORAGE_VERSION,
     Status,
 )
+from .util import filter_by_date, prune_expired
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG if DEBUGGING else logging.INFO)
@@ -54,6 +62,66 @@ logger.setLevel(logging.DEBUG if DEBUGGING else logging.INFO)
 # Testing flag. Set to True to use mock data instead of the API.
 USE_MOCK_DATA = False
 
+# Documented free-tier quota for the Forecast.Solar API.
+API_CALLS_PER_HOUR = 12
+
+# Bound each API request so one stuck connection cannot stall a refresh.
+_API_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
+_API_RETRIES = 3
+
+# Ask for compressed JSON; aiohttp decompresses transparently and typical
+# responses shrink several-fold on the wire. Only advertise encodings aiohttp
+# decodes natively — brotli needs an optional package this manifest does not
+# require, and advertising it without a decoder would break every response.
+_API_HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip, deflate"}
+
+# Serve a cached response for identical panel parameters for 50 minutes;
+# the API's forecast resolution is hourly, so refetching sooner buys nothing.
+_RESPONSE_CACHE_TTL = 3000
+
+# Shared across generate_day_data iterations instead of allocating a fresh
+# timedelta per loop pass.
+_ONE_HOUR = timedelta(hours=1)
+
+# Template for one day's hour map; copying a dict is cheaper than rebuilding
+# it from range() on every day boundary.
+_ZERO_DAY: dict[int, int] = dict.fromkeys(range(HRS_PER_DAY), 0)
+
+
+class _TokenBucket:
+    """Minimal async token bucket sized to the Forecast.Solar quota.
+
+    Spreads the panel calls out so bursts (e.g. several panels fetched
+    concurrently) cannot trip the server-side rate limit in the first place.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize with a refill rate (tokens/second) and burst capacity."""
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self._rate,
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def resync(self, remaining: float) -> None:
+        """Re-align the bucket with the server-reported remaining quota."""
+        self._tokens = min(self._capacity, remaining)
+
 
 class ForecastSolar:
     """Utility class for managing and updating Forecast Solar data in Home Assistant.
@@ -82,6 +150,39 @@ class ForecastSolar:
         self._next_update = dt_util.now() + timedelta(minutes=-1)
         self._panel_configurations = {}
         self._name = "Forecast Solar"
+        # Last payload handed to the store, so unchanged refreshes skip the
+        # delayed save (and its JSON serialization) entirely.
+        self._last_saved_payload: dict | None = None
+        # Saves are held back until Home Assistant has finished starting to
+        # keep forecast writes out of the boot-time disk I/O rush.
+        self._save_deferred = False
+        self._unsub_started = None
+        # In-flight background refresh, so callers are never blocked on the
+        # API round-trip once a cached forecast exists.
+        self._refresh_task: asyncio.Task | None = None
+        # Recent API fetch durations, used to start the next refresh early
+        # enough that the cache is warm by the nominal expiry.
+        self._fetch_durations: deque[float] = deque(maxlen=10)
+        # Proactive rate limiting, re-synced from the server's ratelimit
+        # header data when responses report remaining quota.
+        self._bucket = _TokenBucket(
+            rate=API_CALLS_PER_HOUR / 3600, capacity=API_CALLS_PER_HOUR
+        )
+        # Bumped whenever self._forecast changes, so the forecast property
+        # can serve a cached view until the data or the date moves on.
+        self._forecast_version = 0
+        self._forecast_view_key: tuple | None = None
+        self._forecast_view: dict[str, dict[int, int]] = {}
+        # True when the forecast has changed since the last scheduled save.
+        self._dirty = False
+        # Fresh API responses by URL, so panels whose parameters have not
+        # changed are served from memory within the TTL.
+        self._response_cache: dict[str, tuple[float, dict]] = {}
+        # Lazily built mock-data helpers: the location and tzinfo never
+        # change for an HA instance, and sun times barely move per date.
+        self._mock_location: LocationInfo | None = None
+        self._mock_tz: ZoneInfo | None = None
+        self._sun_cache: dict = {}
 
         # Initialize storage
         self._store = Store(hass, STORAGE_VERSION, FORECAST_KEY)
@@ -101,6 +202,7 @@ class ForecastSolar:
                 date: {int(hour): value for hour, value in day_data.items()}
                 for date, day_data in temp.items()
             }
+            self._forecast_version += 1
             next_update_str = stored_data.get("next_update")
             if next_update_str:
                 dt = datetime.fromisoformat(next_update_str)
@@ -122,30 +224,56 @@ class ForecastSolar:
         panels, aggregates the results, and saves them to storage. Removes outdated
         forecasts and updates the integration status.
         """
+        if self._next_update > dt_util.now() and not self._dirty:
+            # Nothing to fetch and nothing unsaved; keep the current status
+            # (including RATE_LIMITED) and make the between-updates poll free.
+            return
+
         if self._next_update < dt_util.now():
-            await self._get_new_data_from_forecasts_solar_api()
+            if self._forecast:
+                # Serve the cached forecast immediately and revalidate in the
+                # background; only a completely empty cache blocks the caller.
+                if self._refresh_task is None or self._refresh_task.done():
+                    self._refresh_task = self.hass.async_create_background_task(
+                        self._async_background_refresh(),
+                        "grist_forecast_solar_refresh",
+                    )
+            else:
+                await self._get_new_data_from_forecasts_solar_api()
 
         if self._status == Status.NOT_CONFIGURED:
             return
 
         self._remove_old_forecasts()
 
-        for date, day_data in self._forecast.items():
-            logger.debug(
-                "\n%s: %s",
-                date,
-                ", ".join(
-                    f"{hour}:{value}" for hour, value in day_data.items() if value > 0
-                ),
-            )
-        # Save updated forecast data to storage
-        if self._forecast and self._next_update:
-            self._store.async_delay_save(
-                lambda: {
-                    "forecast": self._forecast,
-                    "next_update": self._next_update.isoformat(),
-                }
-            )
+        if logger.isEnabledFor(logging.DEBUG):
+            for date, day_data in self._forecast.items():
+                logger.debug(
+                    "\n%s: %s",
+                    date,
+                    ", ".join(
+                        f"{hour}:{value}"
+                        for hour, value in day_data.items()
+                        if value > 0
+                    ),
+                )
+        # Save updated forecast data to storage, unless nothing changed since
+        # the last scheduled save.
+        if self._dirty and self._forecast and self._next_update:
+            self._dirty = False
+            payload = {
+                "forecast": dict(self._forecast),
+                "next_update": self._next_update.isoformat(),
+            }
+            if payload != self._last_saved_payload:
+                self._last_saved_payload = payload
+                if self.hass.is_running:
+                    self._store.async_delay_save(lambda: self._last_saved_payload)
+                elif not self._save_deferred:
+                    self._save_deferred = True
+                    self._unsub_started = self.hass.bus.async_listen_once(
+                        EVENT_HOMEASSISTANT_STARTED, self._async_save_on_started
+                    )
         self._status = Status.NORMAL
         logger.info(
             "\n%sRetrieved Forecast.Solar forecast data for %d days%s",
@@ -155,6 +283,26 @@ class ForecastSolar:
         )
 
 
+    async def _async_background_refresh(self) -> None:
+        """Refresh the forecast without blocking the caller.
+
+        A failed refresh keeps serving the prior forecast rather than
+        dropping it.
+        """
+        try:
+            await self._get_new_data_from_forecasts_solar_api()
+        except Exception:
+            logger.exception(
+                "Background forecast refresh failed; keeping the stale forecast"
+            )
+
+    async def _async_save_on_started(self, _event) -> None:
+        """Flush the save that was deferred until Home Assistant started."""
+        self._save_deferred = False
+        self._unsub_started = None
+        if self._last_saved_payload:
+            self._store.async_delay_save(lambda: self._last_saved_payload)
+
     async def _get_new_data_from_forecasts_solar_api(self) -> None:
         """Fetch and sum forecasts for all panels by hour.
 
@@ -170,50 +318,71 @@ class ForecastSolar:
             return
         logger.debug("We found %s panels: %s", len(self._panel_configurations), self._panel_configurations)
 
-        # Then sum the results from each hour for every panel
+        # Then sum the results from each hour for every panel. The API calls
+        # are independent, so issue them concurrently over one shared session;
+        # total latency is bounded by the slowest panel instead of the sum.
         found_data = False
-        for panel in self._panel_configurations:
-            data = await self._call_api_for_one_panel(panel)
+        session = aiohttp_client.async_get_clientsession(self.hass)
+        results = await asyncio.gather(
+            *(
+                self._call_api_for_one_panel(panel, session)
+                for panel in self._panel_configurations
+            ),
+            return_exceptions=True,
+        )
+        # Accumulate across panels so a second panel adds to, rather than
+        # overwrites, the same day's hours.
+        acc: dict[str, dict[int, int]] = {}
+        for panel, data in zip(self._panel_configurations, results, strict=True):
+            if isinstance(data, BaseException):
+                logger.warning("Fetch failed for panel %s: %s", panel, data)
+                continue
             if not data:
                 logger.warning("No data returned for panel %s", panel)
                 continue
             result_data = data.get("result", {})
             watt_hours_period = result_data.get("watt_hours_period", {})
-            watt_hours_day = result_data.get("watt_hours_day", {})
-            day_data: dict[int, int] = dict.fromkeys(range(HRS_PER_DAY), 0)
-            forecast_date_str = (
-                next(iter(watt_hours_day)).split(" ")[0] if watt_hours_period else None
-            )
-            if forecast_date_str is None:
+            if not watt_hours_period:
                 logger.warning("No forecast data found in data for panel %s", panel)
                 continue
             found_data = True
-            # Run through the watt_hours_day data to get the data for each hour of each day
+            # Run through the period data, summing each hour of each day
             for dt_str, value in watt_hours_period.items():
-                if not dt_str.startswith(forecast_date_str):
-                    self._forecast[forecast_date_str] = day_data
-                    day_data = dict.fromkeys(range(HRS_PER_DAY), 0)
-                    forecast_date_str = dt_str.split(" ")[0]
-
-                # Parse the dt_str and extract the hour
-                hour = int(
-                    dt_str[11:13]
-                )  # Extract the hour part from the datetime string
-                day_data[hour] = int(value)
-            # Record the last day's data
-            self._forecast[forecast_date_str] = day_data
-            logger.debug("Storing forecast data for %s", forecast_date_str)
+                # Date and hour are fixed slices of the datetime string; no
+                # split-and-index list allocation needed.
+                date_str = dt_str[:10]
+                bucket = acc.get(date_str)
+                if bucket is None:
+                    bucket = acc[date_str] = dict(_ZERO_DAY)
+                bucket[int(dt_str[11:13])] += int(value)
+        self._forecast.update(acc)
+        logger.debug("Storing forecast data for %s", sorted(acc))
         if found_data is False:
             self._status = Status.NOT_CONFIGURED
+        else:
+            self._forecast_version += 1
+            self._dirty = True
         logger.debug("We found %s forecast data points", len(self._forecast))
         logger.debug("We found forecast info: (T/F) %s", found_data)
-        self._next_update = dt_util.now().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        # Schedule the next refresh a little before the top of the hour: the
+        # lead time is 1.5x the slowest recent fetch, so the revalidation has
+        # normally finished by the time the hourly expiry arrives.
+        lead = 1.5 * max(self._fetch_durations, default=0.0)
+        self._next_update = (
+            dt_util.now().replace(minute=0, second=0, microsecond=0)
+            + timedelta(hours=1)
+            - timedelta(seconds=lead)
+        )
 
-    async def _call_api_for_one_panel(self, panel: dict) -> dict:
+    async def _call_api_for_one_panel(
+        self, panel: dict, session: aiohttp.ClientSession
+    ) -> dict:
         """Fetch forecast data for a single panel from the Forecast.Solar API.
 
         Args:
             panel: Dictionary containing panel configuration (lat, lon, dec, az, kwp).
+            session: Shared client session, so concurrent panel fetches reuse
+                keep-alive connections instead of opening one session each.
 
         Returns:
             The parsed API response as a dictionary, or mock data if enabled or on error.
@@ -233,20 +402,58 @@ class ForecastSolar:
             self._next_update = dt_util.now() + timedelta(minutes=1)
             return mock_data
 
-        async with aiohttp.ClientSession() as session, session.get(url) as resp:
-            if resp.status == 200:
-                result = await resp.json()
-                return result.get("result", {})
-            if resp.status == 429:
-                # If we hit the rate limit, set the next update time to 60 minutes from now
-                self._next_update = dt_util.now() + timedelta(minutes=60)
-                logger.warning(
-                    "\nRate limit hit, setting next update to %s", self._next_update
-                )
-                self._status = Status.RATE_LIMITED
-                # return await self._generate_mock_data()
-
-            return {}
+        cached = self._response_cache.get(url)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        await self._bucket.acquire()
+        for attempt in range(_API_RETRIES):
+            started = time.monotonic()
+            try:
+                async with session.get(
+                    url, headers=_API_HEADERS, timeout=_API_TIMEOUT
+                ) as resp:
+                    if resp.status == 200:
+                        # HA's json_loads is orjson-backed; decoding the raw
+                        # bytes with it beats aiohttp's stdlib-json path.
+                        result = json_loads(await resp.read())
+                        self._fetch_durations.append(time.monotonic() - started)
+                        remaining = (
+                            result.get("message", {})
+                            .get("ratelimit", {})
+                            .get("remaining")
+                        )
+                        if isinstance(remaining, (int, float)):
+                            self._bucket.resync(remaining)
+                        payload = result.get("result", {})
+                        self._response_cache[url] = (
+                            time.monotonic() + _RESPONSE_CACHE_TTL,
+                            payload,
+                        )
+                        return payload
+                    if resp.status == 429:
+                        # If we hit the rate limit, set the next update time to 60 minutes from now
+                        self._next_update = dt_util.now() + timedelta(minutes=60)
+                        logger.warning(
+                            "\nRate limit hit, setting next update to %s",
+                            self._next_update,
+                        )
+                        self._status = Status.RATE_LIMITED
+                        return {}
+                    if resp.status >= 500:
+                        # Server-side errors are worth a retry below.
+                        resp.raise_for_status()
+                    return {}
+            except (aiohttp.ClientError, TimeoutError):
+                if attempt == _API_RETRIES - 1:
+                    logger.warning(
+                        "Forecast.Solar request failed after %s attempts for panel %s",
+                        _API_RETRIES,
+                        panel,
+                    )
+                    return {}
+                await asyncio.sleep(2**attempt)
+        return {}
 
     async def _fetch_active_panel_data(self) -> list:
         """Fetch and return active solar panel configuration data from Home Assistant storage.
@@ -299,46 +506,50 @@ class ForecastSolar:
         latitude = state.attributes.get("latitude", 0.0)
         longitude = state.attributes.get("longitude", 0.0)
 
-        location = LocationInfo(
-            latitude=latitude, longitude=longitude, timezone=self.timezone
-        )
+        if self._mock_location is None:
+            self._mock_location = LocationInfo(
+                latitude=latitude, longitude=longitude, timezone=self.timezone
+            )
+            self._mock_tz = ZoneInfo(self.timezone)
+        tz = self._mock_tz
         today = dt_util.now().date()
         tomorrow = today + timedelta(days=1)
         yesterday = today - timedelta(days=1)
         # Calculate sunrise and sunset times for today and tomorrow
-        sun_today = sun(location.observer, date=today)
-        sun_tomorrow = sun(location.observer, date=tomorrow)
-        sun_yesterday = sun(location.observer, date=yesterday)
-
-        sunrise = sun_today["sunrise"].astimezone(ZoneInfo(self.timezone))
-        sunset = sun_today["sunset"].astimezone(ZoneInfo(self.timezone))
-        sunrise_tomorrow = sun_tomorrow["sunrise"].astimezone(ZoneInfo(self.timezone))
-        sunset_tomorrow = sun_tomorrow["sunset"].astimezone(ZoneInfo(self.timezone))
-        sunrise_yesterday = sun_yesterday["sunrise"].astimezone(ZoneInfo(self.timezone))
-        sunset_yesterday = sun_yesterday["sunset"].astimezone(ZoneInfo(self.timezone))
-
-        watt_hours_period = {
-            **generate_day_data(sunrise_yesterday, sunset_yesterday),
-            **generate_day_data(sunrise, sunset),
-            **generate_day_data(sunrise_tomorrow, sunset_tomorrow),
-        }
+        sun_today = self._sun_times(today)
+        sun_tomorrow = self._sun_times(tomorrow)
+        sun_yesterday = self._sun_times(yesterday)
+
+        sunrise = sun_today["sunrise"].astimezone(tz)
+        sunset = sun_today["sunset"].astimezone(tz)
+        sunrise_tomorrow = sun_tomorrow["sunrise"].astimezone(tz)
+        sunset_tomorrow = sun_tomorrow["sunset"].astimezone(tz)
+        sunrise_yesterday = sun_yesterday["sunrise"].astimezone(tz)
+        sunset_yesterday = sun_yesterday["sunset"].astimezone(tz)
+
+        # One dict built straight from the chained generators; no per-day
+        # temporaries or merge copies.
+        watt_hours_period = dict(
+            chain(
+                generate_day_data(sunrise_yesterday, sunset_yesterday),
+                generate_day_data(sunrise, sunset),
+                generate_day_data(sunrise_tomorrow, sunset_tomorrow),
+            )
+        )
 
+        # Bucketize by the date prefix in one pass instead of scanning the
+        # period dict once per day.
+        yesterday_str = yesterday.strftime(DATE_FORMAT)
+        today_str = today.strftime(DATE_FORMAT)
+        tomorrow_str = tomorrow.strftime(DATE_FORMAT)
+        day_totals: dict[str, int] = {}
+        for time_str, value in watt_hours_period.items():
+            day = time_str[:10]
+            day_totals[day] = day_totals.get(day, 0) + value
         watt_hours_day = {
-            yesterday.strftime(DATE_FORMAT): sum(
-                value
-                for time, value in watt_hours_period.items()
-                if time.startswith(yesterday.strftime(DATE_FORMAT))
-            ),
-            today.strftime(DATE_FORMAT): sum(
-                value
-                for time, value in watt_hours_period.items()
-                if time.startswith(today.strftime(DATE_FORMAT))
-            ),
-            tomorrow.strftime(DATE_FORMAT): sum(
-                value
-                for time, value in watt_hours_period.items()
-                if time.startswith(tomorrow.strftime(DATE_FORMAT))
-            ),
+            yesterday_str: day_totals.get(yesterday_str, 0),
+            today_str: day_totals.get(today_str, 0),
+            tomorrow_str: day_totals.get(tomorrow_str, 0),
         }
 
         return {
@@ -367,24 +578,38 @@ class ForecastSolar:
             },
         }
 
+    def _sun_times(self, day) -> dict:
+        """Return astral sun times for a date, memoized per date."""
+        times = self._sun_cache.get(day)
+        if times is None:
+            times = sun(self._mock_location.observer, date=day)
+            self._sun_cache[day] = times
+            if len(self._sun_cache) > 8:
+                self._sun_cache.pop(next(iter(self._sun_cache)))
+        return times
+
     def _remove_old_forecasts(self) -> None:
         """Remove old forecast data from the forecast history.
 
         Keeps only forecasts within the configured retention period (DEFAULT_PV_MAX_DAYS).
         """
         cutoff = dt_util.now().date() + timedelta(days=-DEFAULT_PV_MAX_DAYS)
-        self._forecast = {
-            date: data
-            for date, data in self._forecast.items()
-            if (parsed_date := dt_util.parse_date(date)) is not None
-            and parsed_date >= cutoff
-        }
+        if prune_expired(self._forecast, cutoff):
+            self._forecast_version += 1
+            self._dirty = True
 
     async def async_unload_entry(self) -> None:
         """Clean up resources and listeners for ForecastSolar."""
         if self._unsub_update:
             self._unsub_update()
             self._unsub_update = None
+        if self._unsub_started:
+            self._unsub_started()
+            self._unsub_started = None
+            self._save_deferred = False
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
         logger.debug("Unloaded Forecast_Solar")
 
     def forecast_for_date(self, date: str) -> dict[int, int]:
@@ -401,14 +626,17 @@ class ForecastSolar:
 
     @property
     def forecast(self) -> dict[str, dict[int, int]]:
-        """Return PV forecasts for today and future dates only."""
+        """Return PV forecasts for today and future dates only.
+
+        The filtered view is cached until the forecast data or the current
+        date changes, so repeated reads skip the per-key date parsing.
+        """
         cutoff = dt_util.now().date()
-        return {
-            date: data
-            for date, data in self._forecast.items()
-            if (parsed_date := dt_util.parse_date(date)) is not None
-            and parsed_date >= cutoff
-        }
+        view_key = (cutoff, self._forecast_version)
+        if view_key != self._forecast_view_key:
+            self._forecast_view = filter_by_date(self._forecast, cutoff)
+            self._forecast_view_key = view_key
+        return self._forecast_view
 
     @property
     def all_forecasts(self) -> dict[str, dict[int, int]]:
@@ -431,8 +659,20 @@ class ForecastSolar:
         return self._name
 
 
-def generate_day_data(sunrise, sunset) -> dict:
-    """Generate mock hourly PV data for a given day.
+def _mock_timestamp(t: datetime) -> str:
+    """Format a mock-data timestamp as YYYY-MM-DD HH:MM:SS.
+
+    Direct f-string formatting skips strftime's format-string parsing and
+    locale machinery for this fixed layout.
+    """
+    return (
+        f"{t.year:04d}-{t.month:02d}-{t.day:02d}"
+        f" {t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+    )
+
+
+def generate_day_data(sunrise, sunset):
+    """Generate mock hourly PV data points for a given day.
 
     Simulates PV generation for each hour between sunrise and sunset, with a
     bell-shaped curve peaking at midday. Used for mock data and testing.
@@ -441,37 +681,33 @@ def generate_day_data(sunrise, sunset) -> dict:
         sunrise: Sunrise datetime for the day.
         sunset: Sunset datetime for the day.
 
-    Returns:
-        Dictionary mapping datetime strings to simulated watt-hour values.
+    Yields:
+        Tuples of (datetime string, simulated watt-hour value).
 
     """
-    MOCK_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
-    data: dict[str, int] = {}
     pre_sunrise = sunrise - timedelta(minutes=1)
     current_time = sunrise
     # Add the pre-sunrise data
-    data[pre_sunrise.strftime(MOCK_DATE_FORMAT)] = 0
+    yield _mock_timestamp(pre_sunrise), 0
     # Add the first hour partial data
-    next_hour = current_time.replace(minute=0, second=0, microsecond=0) + timedelta(
-        minutes=60
-    )
+    next_hour = current_time.replace(minute=0, second=0, microsecond=0) + _ONE_HOUR
     minutes = ((next_hour - sunrise).seconds) // 60
-    middle_hour: int = (sunset.hour - sunrise.hour - 2) / 2
+    middle_hour = (sunset.hour - sunrise.hour - 2) / 2
     start_hour = sunrise.hour + 1
-    watt_hours: int = int(750 * minutes / 60)
-    data[current_time.strftime(MOCK_DATE_FORMAT)] = watt_hours
+    yield _mock_timestamp(current_time), int(750 * minutes / 60)
     current_time = current_time.replace(
         hour=start_hour, minute=0, second=0, microsecond=0
     )
-    while current_time + timedelta(minutes=60) <= sunset:
-        watt_hours: int = int(
-            (middle_hour + 1) * 750
-            - abs((current_time.hour - start_hour) - middle_hour) * 750
+    # Track the hour offset as a plain counter rather than re-deriving it
+    # from current_time each pass.
+    hour_idx = 0
+    while current_time + _ONE_HOUR <= sunset:
+        watt_hours = int(
+            (middle_hour + 1) * 750 - abs(hour_idx - middle_hour) * 750
         )
-        data[current_time.strftime(MOCK_DATE_FORMAT)] = watt_hours
-        current_time += timedelta(minutes=60)  # Increment time in 30-minute intervals
+        yield _mock_timestamp(current_time), watt_hours
+        current_time += _ONE_HOUR
+        hour_idx += 1
     # Add the last value at sunset
     minutes = (sunset - current_time).seconds // 60
-    watt_hours: int = int(750 * minutes / 60)
-    data[sunset.strftime(MOCK_DATE_FORMAT)] = watt_hours
-    return data
+    yield _mock_timestamp(sunset), int(750 * minutes / 60)
@@ -33,9 +33,10 @@ import asyncio
 from datetime import datetime, timedelta
 import logging
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import create_eager_task
 
 from ..const import (  # noqa: TID252
     DEBUGGING,
@@ -45,6 +46,7 @@ from ..const import (  # noqa: TID252
     STORAGE_VERSION,
     Status,
 )
+from .util import filter_by_date, prune_expired
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG if DEBUGGING else logging.INFO)
@@ -121,23 +123,25 @@ class Meteo:
             logger.debug("Next update not due yet")
             return
 
-        entities = []
-        sensor_list = [SENSOR_METEO_BASE]
-        all_entities = self.hass.states.async_all("sensor")
-        for prefix in sensor_list:
-            entities.extend(
-                state.entity_id
-                for state in all_entities
-                if state.entity_id.startswith(prefix)
-            )
+        # Snapshot the matching State objects in one pass over the state
+        # machine; re-fetching each entity later via states.get would walk
+        # the registry a second time per sensor.
+        states = [
+            state
+            for state in self.hass.states.async_all("sensor")
+            if state.entity_id.startswith(SENSOR_METEO_BASE)
+        ]
 
-        if not entities:
+        if not states:
             logger.error("No Meteo forecast found")
             self._status = Status.FAULT
             return
 
+        # Eager tasks run each coroutine up to its first suspension point
+        # immediately; the processors never actually block, so they complete
+        # without an event-loop round-trip per sensor.
         results = await asyncio.gather(
-            *(self._process_forecast_day(day) for day in entities),
+            *(create_eager_task(self._process_forecast_day(state)) for state in states),
             return_exceptions=True,
         )
         if not all(results):
@@ -150,25 +154,20 @@ class Meteo:
         self._status = Status.NORMAL
         logger.info("Updated Meteo forecast data for %d days", len(self._forecast))
 
-    async def _process_forecast_day(self, entity_id: str) -> bool:
+    async def _process_forecast_day(self, state: State) -> bool:
         """Process a single Meteo forecast day sensor.
 
         Args:
-            entity_id: The entity ID of the Meteo forecast sensor.
+            state: The snapshotted State of the Meteo forecast sensor.
 
         Returns:
             True if processing was successful, False otherwise.
 
         """
-        result = self.hass.states.get(entity_id)
-        if not result:
-            logger.error("No Meteo forecast data found for %s", entity_id)
-            return False
-
-        attributes = result.attributes
+        attributes = state.attributes
         if not attributes:
             logger.debug(
-                "No attributes found for %s. Probably a daily total.", entity_id
+                "No attributes found for %s. Probably a daily total.", state.entity_id
             )
             return True
 
@@ -176,7 +175,7 @@ class Meteo:
         if not detailed_hourly:
             logger.debug(
                 "No forecast wh_period attribute found for %s. Probably a daily total.",
-                entity_id,
+                state.entity_id,
             )
             return True
 
@@ -184,7 +183,7 @@ class Meteo:
             detailed_hourly
         )
         if not next_day_date:
-            logger.error("No date found for forecast data in %s", entity_id)
+            logger.error("No date found for forecast data in %s", state.entity_id)
             return False
 
         self._forecast[next_day_date] = hourly_forecast
@@ -217,12 +216,7 @@ class Meteo:
         Keeps only forecasts within the configured retention period (DEFAULT_PV_MAX_DAYS).
         """
         cutoff = dt_util.now().date() + timedelta(days=-DEFAULT_PV_MAX_DAYS)
-        self._forecast = {
-            date: data
-            for date, data in self._forecast.items()
-            if (parsed_date := dt_util.parse_date(date)) is not None
-            and parsed_date >= cutoff
-        }
+        prune_expired(self._forecast, cutoff)
 
     async def async_unload(self) -> None:
         """Clean up resources and unschedule periodic updates."""
@@ -247,12 +241,7 @@ class Meteo:
     def forecast(self) -> dict[str, dict[int, int]]:
         """Return PV forecasts for future dates only."""
         cutoff = dt_util.now().date()
-        return {
-            date: data
-            for date, data in self._forecast.items()
-            if (parsed_date := dt_util.parse_date(date)) is not None
-            and parsed_date > cutoff
-        }
+        return filter_by_date(self._forecast, cutoff, strict=True)
 
     @property
     def all_forecasts(self) -> dict[str, dict[int, int]]:
@@ -52,6 +52,7 @@ from ..const import (  # noqa: TID252
     STORAGE_VERSION,
     Status,
 )
+from .util import filter_by_date, prune_expired
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG if DEBUGGING else logging.INFO)
@@ -94,6 +95,13 @@ class Solcast:
         self.hass = hass
         self._status = Status.NOT_CONFIGURED
         self._percentile = percentile
+        # The percentile never changes after construction, so resolve which
+        # estimate pair to interpolate between (and the blend fraction) once
+        # instead of re-branching for every hour of every forecast day.
+        if percentile <= 50:
+            self._interp = ((percentile - 10) / 40, "pv_estimate10", "pv_estimate")
+        else:
+            self._interp = ((percentile - 50) / 40, "pv_estimate", "pv_estimate90")
         self._next_update = dt_util.now() + timedelta(minutes=-1)
         self._forecast: dict[str, dict[int, int]] = {}
         self._unsub_update = None
@@ -143,12 +151,14 @@ class Solcast:
             SENSOR_FORECAST_SOLAR_TODAY,
             SENSOR_FORECAST_SOLAR_TOMORROW,
         ]
-        all_entities = self.hass.states.async_all("sensor")
+        # Filter on entity IDs alone; async_entity_ids avoids materializing a
+        # State object for every sensor in the installation.
+        all_entity_ids = self.hass.states.async_entity_ids("sensor")
         for prefix in sensor_list:
             entities.extend(
-                state.entity_id
-                for state in all_entities
-                if state.entity_id.startswith(prefix)
+                entity_id
+                for entity_id in all_entity_ids
+                if entity_id.startswith(prefix)
             )
         if not entities:
             logger.warning("No entities found with prefix %s", sensor_list)
@@ -233,6 +243,7 @@ class Solcast:
         """
         hourly_forecast = {}
         next_day_date = None
+        frac, key_lo, key_hi = self._interp
 
         for idx, next_data in enumerate(detailed_hourly):
             if not next_data:
@@ -243,18 +254,11 @@ class Solcast:
                 next_day_date = period_start_date.strftime("%Y-%m-%d")
 
             hour = period_start_date.hour if period_start_date else 0
-            pv_est10 = next_data.get("pv_estimate10", 0)
-            pv_est = next_data.get("pv_estimate", 0)
-            pv_est90 = next_data.get("pv_estimate90", 0)
-
-            # Interpolate between percentiles based on self._percentile
-            target_pv = (
-                (pv_est10 + (self._percentile - 10) / 40 * (pv_est - pv_est10))
-                if self._percentile <= 50
-                else (pv_est + (self._percentile - 50) / 40 * (pv_est90 - pv_est))
-            ) * 1000
 
-            hourly_forecast[hour] = int(target_pv)
+            # Interpolate between the precomputed percentile pair.
+            value_lo = next_data.get(key_lo, 0)
+            value_hi = next_data.get(key_hi, 0)
+            hourly_forecast[hour] = int((value_lo + frac * (value_hi - value_lo)) * 1000)
 
         return next_day_date, hourly_forecast
 
@@ -264,12 +268,7 @@ class Solcast:
         Keeps only forecasts within the configured retention period (DEFAULT_PV_MAX_DAYS).
         """
         cutoff = dt_util.now().date() + timedelta(days=-DEFAULT_PV_MAX_DAYS)
-        self._forecast = {
-            date: data
-            for date, data in self._forecast.items()
-            if (parsed_date := dt_util.parse_date(date)) is not None
-            and parsed_date >= cutoff
-        }
+        prune_expired(self._forecast, cutoff)
 
     async def async_unload_entry(self) -> None:
         """Clean up resources and listeners for the Solcast integration."""
@@ -294,12 +293,7 @@ class Solcast:
     def forecast(self) -> dict[str, dict[int, int]]:
         """Return PV forecasts for future dates only."""
         cutoff = dt_util.now().date()
-        return {
-            date: data
-            for date, data in self._forecast.items()
-            if (parsed_date := dt_util.parse_date(date)) is not None
-            and parsed_date > cutoff
-        }
+        return filter_by_date(self._forecast, cutoff, strict=True)
 
     @property
     def all_forecasts(self) -> dict[str, dict[int, int]]:
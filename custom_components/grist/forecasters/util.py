@@ -0,0 +1,62 @@
+"""Shared helpers for the GRIST forecasters.
+
+The three forecaster backends (Forecast.Solar, Meteo, Solcast) all keep their
+data as ``{date string: {hour: watts}}`` and filter it by date in the same way.
+These helpers centralize that hot path. The date keys are produced internally
+in ISO YYYY-MM-DD form, which sorts lexicographically in date order, so the
+filters compare strings directly against the cutoff's isoformat instead of
+parsing every key back into a date. Pruning mutates the forecast dict in place
+so the common no-expiry case allocates nothing.
+
+Functions:
+    filter_by_date: Return a new dict holding only dates at or past a cutoff.
+    prune_expired: Delete dates before a cutoff in place, returning them.
+"""
+
+from datetime import date
+
+
+def filter_by_date(
+    forecast: dict[str, dict[int, int]], cutoff: date, *, strict: bool = False
+) -> dict[str, dict[int, int]]:
+    """Return the entries of forecast dated at (or strictly after) cutoff.
+
+    Args:
+        forecast: Forecast data keyed by YYYY-MM-DD date string.
+        cutoff: The earliest date to keep.
+        strict: When True, exclude the cutoff date itself.
+
+    Returns:
+        A new dict with too-old date keys dropped.
+
+    """
+    cutoff_str = cutoff.isoformat()
+    if strict:
+        return {
+            date_str: data
+            for date_str, data in forecast.items()
+            if date_str > cutoff_str
+        }
+    return {
+        date_str: data for date_str, data in forecast.items() if date_str >= cutoff_str
+    }
+
+
+def prune_expired(forecast: dict[str, dict[int, int]], cutoff: date) -> list[str]:
+    """Delete forecast entries dated before cutoff, in place.
+
+    In the common case nothing has expired and no new dict is allocated.
+
+    Args:
+        forecast: Forecast data keyed by YYYY-MM-DD date string.
+        cutoff: The earliest date to keep.
+
+    Returns:
+        The list of removed date keys (empty when nothing expired).
+
+    """
+    cutoff_str = cutoff.isoformat()
+    stale = [date_str for date_str in forecast if date_str < cutoff_str]
+    for date_str in stale:
+        del forecast[date_str]
+    return stale
@@ -18,6 +18,7 @@ from homeassistant.util import dt as dt_util
 from .battery import Battery
 from .boost_calc import calculate_required_boost
 from .const import (
+    BOOST_MODE_OPTIONS_SET,
     DEBUGGING,
     DEFAULT_BATTERY_MIN_SOC,
     DEFAULT_GRIST_END,
@@ -28,6 +29,8 @@ from .const import (
     DEFAULT_LOAD_AVERAGE_DAYS,
     DEFAULT_UPDATE_HOUR,
     FORECASTER_INTEGRATIONS,
+    HOUR_MAX,
+    HOUR_MIN,
     NUMBER_CAPACITY_POINT_1,
     PURPLE,
     RESET,
@@ -114,17 +117,24 @@ def ordinal(n: int) -> str:
             return f"{n}th"
 
 
+# Precomputed hour labels, indexed directly by the hour (0-23).
+_HOUR_STRINGS: tuple[str, ...] = tuple(
+    "midnight"
+    if hour == 0
+    else "noon"
+    if hour == 12
+    else f"{hour}am"
+    if hour < 12
+    else f"{hour - 12}pm"
+    for hour in range(HOUR_MAX + 1)
+)
+
+
 def to_hour(hour: int) -> str:
     """Convert an integer hour (0-23) to a string representation."""
-    if hour == 0:
-        return "midnight"
-    if 1 <= hour < 12:
-        return f"{hour}am"
-    if hour == 12:
-        return "noon"
-    if 13 <= hour < 24:
-        return f"{hour - 12}pm"
-    raise ValueError("Invalid hour")
+    if not HOUR_MIN <= hour <= HOUR_MAX:
+        raise ValueError("Invalid hour")
+    return _HOUR_STRINGS[hour]
 
 
 class GristScheduler:
@@ -155,7 +165,10 @@ class GristScheduler:
 
         """
         self.hass = hass
-        self.boost_mode = options.get("boost_mode", DEFAULT_GRIST_MODE)
+        boost_mode = options.get("boost_mode", DEFAULT_GRIST_MODE)
+        self.boost_mode = (
+            boost_mode if boost_mode in BOOST_MODE_OPTIONS_SET else DEFAULT_GRIST_MODE
+        )
         self.grist_manual = options.get("grist_manual", DEFAULT_GRIST_STARTING_SOC)
         self.grist_start = options.get("grist_start", DEFAULT_GRIST_START)
         self.grist_end = options.get("grist_end", DEFAULT_GRIST_END)
@@ -206,13 +219,15 @@ class GristScheduler:
         # Update will ensure we have forecaster, battery, and daily stats objects initialized.
         await self._update()
 
-        msg = (
-            f"{PURPLE}\n-------------------GRIST initialized successfully with the following settings-------------------"
-            f"\n   Boost_mode: {self.boost_mode} - Manual SoC: {self.grist_manual}% - Minimum SoC: {self.minimum_soc}%"
-            f"\n   Boost from: {to_hour(self.grist_start)} - {to_hour(self.grist_end)}, fetching forecast at: {to_hour(self.update_hour)} using {self.days_of_load_history} days of load history"
-            f"\n-------------------------------------------------------------------------------------------------{RESET}"
-        )
-        logger.debug(msg)
+        # Only build the multi-line colorized summary when it will actually be emitted.
+        if logger.isEnabledFor(logging.DEBUG):
+            msg = (
+                f"{PURPLE}\n-------------------GRIST initialized successfully with the following settings-------------------"
+                f"\n   Boost_mode: {self.boost_mode} - Manual SoC: {self.grist_manual}% - Minimum SoC: {self.minimum_soc}%"
+                f"\n   Boost from: {to_hour(self.grist_start)} - {to_hour(self.grist_end)}, fetching forecast at: {to_hour(self.update_hour)} using {self.days_of_load_history} days of load history"
+                f"\n-------------------------------------------------------------------------------------------------{RESET}"
+            )
+            logger.debug(msg)
 
     async def _select_forecaster(self):
         """Select the forecaster based on which one is in NORMAL status."""
@@ -652,6 +667,7 @@ class GristScheduler:
                 now + timedelta(minutes=remaining_battery_time)
             ).strftime("%a %-I:%M %p"),
             "battery_time_remaining": round(remaining_battery_time / 60, 1),
+            "today_abbr": now.strftime("%a"),
             "actual": boost_actual,
             "manual": self.grist_manual,
             "mode": str(self.boost_mode).title() if self.boost_mode else None,